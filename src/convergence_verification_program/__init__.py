@@ -10,21 +10,45 @@ ASME V&V20 and NASA CFD2030.
 
 __version__ = "0.1.0"
 
-from .mesh import MeshData
-from .study import ConvergenceStudy
-from .standards import AnalysisStandard, StandardRegistry, StandardValidator
-from .validation import validate_mesh_sequence
-from .report import export_as_txt, save_txt_report
-from .exceptions import ConvergenceAnalysisError
+from importlib import import_module
+
+# Public names are resolved lazily (PEP 562) so that importing the package does
+# not pull in NumPy/Pydantic-backed submodules until they are actually used.
+_LAZY_IMPORTS = {
+    "MeshData": ".mesh",
+    "MeshBundle": ".mesh",
+    "ConvergenceStudy": ".study",
+    "AnalysisStandard": ".standards",
+    "StandardRegistry": ".standards",
+    "StandardValidator": ".standards",
+    "validate_mesh_sequence": ".validation",
+    "export_report": ".report",
+    "save_report": ".report",
+    "ConvergenceAnalysisError": ".exceptions",
+}
 
 __all__ = [
     "MeshData",
+    "MeshBundle",
     "ConvergenceStudy",
     "AnalysisStandard",
     "StandardRegistry",
     "StandardValidator",
     "validate_mesh_sequence",
-    "export_as_txt",
-    "save_txt_report",
+    "export_report",
+    "save_report",
     "ConvergenceAnalysisError",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,8 @@ verbosity, and numerical tolerances. It can be imported anywhere
 in the codebase for consistent behavior.
 """
 
+from typing import Final
+
 # === Runtime Modes ===
 STRICT_MODE: bool = True
 """Promote warnings (e.g., near-zero division/log) to runtime errors."""
@@ -16,21 +18,23 @@ VERBOSE_OUTPUT: bool = True
 """Enable console printouts during validation and analysis phases."""
 
 # === Numerical Tolerances ===
-EPSILON: float = 1e-12
+EPSILON: Final[float] = 1e-12
 """Threshold for treating values as near-zero in division/logarithm."""
 
 # === Precision Settings ===
-REPORT_FLOAT_PRECISION: int = 6
-"""Number of decimal places used in plain text or markdown output."""
+REPORT_FLOAT_PRECISION: Final[int] = 6
+"""Number of decimal places to use in all report output (TXT, JSON, Markdown, LaTeX)."""
+
+# === Table Storage ===
+TABLE_DTYPE: str = "float64"
+"""NumPy dtype for Richardson/GCI tables. "float32" halves memory traffic but
+keeps only ~7 significant digits, so it is only safe when every reported value
+fits REPORT_FLOAT_PRECISION decimals within that budget."""
 
 # === Future-Proofing Placeholder ===
 ENABLE_LOGGING: bool = False
 """Enable detailed log file output (planned feature)."""
 
-# === Convergence Report Float Precision ===
-REPORT_FLOAT_PRECISION: int = 6
-"""Number of decimal places to use in all report output (TXT, JSON, Markdown, LaTeX)."""
-
 # === Convergence Report Format ===
 REPORT_FORMAT: str = "txt"  # Options: "txt", "md", "tex"
 """Output format for saved reports."""
\ No newline at end of file
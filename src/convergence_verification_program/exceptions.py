@@ -5,6 +5,8 @@ class ConvergenceAnalysisError(Exception):
     Base exception for all convergence analysis errors.
     """
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: dict = None):
         """
         Parameters
@@ -31,38 +33,56 @@ class ConvergenceAnalysisError(Exception):
             f"details={self.details!r})"
         )
 
+    def __reduce__(self):
+        # Slot attributes are not part of BaseException's pickled state, so
+        # pass them as constructor arguments; anything else set on the
+        # instance (e.g. __notes__) travels in its __dict__.
+        return (self.__class__, (self.message, self.details), self.__dict__ or None)
+
 
 class InvalidRefinementSequenceError(ConvergenceAnalysisError):
     """
     Raised when mesh refinement ratios are out of bounds or improperly defined.
     """
 
+    __slots__ = ()
+
 
 class NonMonotonicConvergenceError(ConvergenceAnalysisError):
     """
     Raised when observed convergence order exhibits oscillation or irregular jumps.
     """
 
+    __slots__ = ()
+
 
 class AsymptoticConvergenceFailure(ConvergenceAnalysisError):
     """
     Raised when GCI values fail to meet the required asymptotic convergence criteria.
     """
 
+    __slots__ = ()
+
 
 class InvalidMeshParameterError(ConvergenceAnalysisError):
     """
     Raised when mesh parameters are missing or contain invalid values.
     """
 
+    __slots__ = ()
+
 
 class InsufficientMeshCountError(ConvergenceAnalysisError):
     """
     Raised when fewer than three mesh levels are provided.
     """
 
+    __slots__ = ()
+
 
 class UnstableGCICalculationError(ConvergenceAnalysisError):
     """
     Raised when GCI calculation fails due to instability or singularity.
-    """
\ No newline at end of file
+    """
+
+    __slots__ = ()
@@ -1,18 +1,127 @@
 # src\convergence_verification_program\local_intra_tuple_convergence_utils.py
 
 import numpy as np
-from typing import Union, Tuple
-
-from .numerics import (
-    safe_division,
-    safe_log,
-    calculate_refinement_ratio,
-    compute_local_order,
-    compute_relative_difference,
-    compute_absolute_difference,
-    compute_gci
-)
+import warnings
+from typing import Union, Tuple, Optional, NamedTuple
+
+from .numerics import safe_division_vec
+from .numerics_numba import fused_tables, romberg_table
 from .standards import StandardParameters
+from .config import EPSILON, STRICT_MODE, TABLE_DTYPE
+
+class TableBundle(NamedTuple):
+    """
+    Per-level tables derived from a Richardson table by `build_all_tables`.
+
+    All fields are (N x N) views into one contiguous (6, N, N) buffer.
+    """
+    P: np.ndarray
+    GCI: np.ndarray
+    Rel: np.ndarray
+    abs_err: np.ndarray
+    rel_err: np.ndarray
+    GCI_ratio: np.ndarray
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """
+    Elementwise `safe_division` that yields NaN wherever either operand is non-finite.
+
+    Parameters
+    ----------
+    numerator : np.ndarray
+        Numerator values.
+    denominator : np.ndarray
+        Denominator values (same shape as `numerator`).
+
+    Returns
+    -------
+    np.ndarray
+        Quotients, NaN where inputs are NaN or infinite.
+    """
+    ok = np.isfinite(numerator) & np.isfinite(denominator)
+    if (ok & (np.abs(denominator) < EPSILON)).any():
+        msg = f"Division by near-zero detected: denominator abs<{EPSILON}"
+        if STRICT_MODE:
+            raise RuntimeError(msg)
+        warnings.warn(msg, RuntimeWarning)
+    quotient = safe_division_vec(numerator, denominator, EPSILON)
+    return np.where(ok, quotient, np.nan).astype(numerator.dtype, copy=False)
+
+def _log_ratios(R: np.ndarray) -> np.ndarray:
+    """
+    Natural log of refinement ratios; non-positive ratios map to NaN/-inf.
+
+    Parameters
+    ----------
+    R : np.ndarray
+        Local refinement ratios.
+
+    Returns
+    -------
+    np.ndarray
+        log(R), computed once so table builders can share it.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log(np.asarray(R, dtype=float))
+
+def _local_order(Ei: np.ndarray, Ej: np.ndarray, logr: np.ndarray) -> np.ndarray:
+    """
+    Vectorized counterpart of `compute_local_order` over one table level.
+
+    Parameters
+    ----------
+    Ei : np.ndarray
+        Solutions on the coarser mesh of each pair.
+    Ej : np.ndarray
+        Solutions on the finer mesh of each pair.
+    logr : np.ndarray
+        Natural log of the local refinement ratios.
+
+    Returns
+    -------
+    np.ndarray
+        Observed orders `p`, NaN where the difference or ratio is invalid.
+    """
+    d = np.abs(Ei - Ej)
+    valid = np.isfinite(logr) & (logr != 0.0) & (d > EPSILON)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(valid, np.log(np.where(valid, d, 1.0)) / logr, np.nan)
+
+def _level_gci(
+    Ei: np.ndarray,
+    Ej: np.ndarray,
+    logr: np.ndarray,
+    sf100: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Observed order, relative error and GCI for one table level.
+
+    Parameters
+    ----------
+    Ei : np.ndarray
+        Solutions on the coarser mesh of each pair.
+    Ej : np.ndarray
+        Solutions on the finer mesh of each pair.
+    logr : np.ndarray
+        Natural log of the local refinement ratios.
+    sf100 : float
+        GCI safety multiplier times 100 (GCI is reported in percent).
+
+    Returns
+    -------
+    p : np.ndarray
+        Observed orders.
+    rel : np.ndarray
+        Relative differences |Ei - Ej| / |Ej|.
+    gci : np.ndarray
+        GCI values (%), NaN where the order denominator is zero or non-finite.
+    """
+    p = _local_order(Ei, Ej, logr)
+    rel = _safe_ratio(np.abs(Ei - Ej), np.abs(Ej))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        denom = np.exp(p * logr) - 1.0
+        gci = sf100 * rel / denom
+    return p, rel, np.where((denom == 0.0) | ~np.isfinite(denom), np.nan, gci)
 
 def build_refinement_ratios(
     node_counts: Union[np.ndarray, list],
@@ -39,15 +148,19 @@ def build_refinement_ratios(
         If any node count is non-positive or dimension is invalid.
     """
     nc = np.asarray(node_counts, dtype=float)
-    if np.any(nc <= 0):
+    if not (nc > 0).all():
         raise ValueError("All node counts must be positive.")
     if dim < 1:
         raise ValueError("Dimension must be at least 1.")
-    return (nc[1:] / nc[:-1]) ** (1.0 / dim)
+    ratio = nc[1:] / nc[:-1]
+    if dim == 1:
+        return ratio
+    return ratio ** (1.0 / dim)
 
 def build_romberg_table(
     values: Union[np.ndarray, list],
-    R: np.ndarray
+    R: np.ndarray,
+    logR: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Construct a full Richardson extrapolation (Romberg) table.
@@ -58,6 +171,8 @@ def build_romberg_table(
         Discrete numerical solutions across mesh levels.
     R : np.ndarray
         Refinement ratios (length N-1 for N mesh levels).
+    logR : np.ndarray, optional
+        Precomputed log(R); computed here if omitted.
 
     Returns
     -------
@@ -71,19 +186,26 @@ def build_romberg_table(
         E[k, i] = E[k-1, i+1] + (E[k-1, i+1] - E[k-1, i]) / (r^p - 1),
     where `p` is the locally estimated order of convergence.
     """
-    v = np.asarray(values, dtype=float)
+    v = np.asarray(values, dtype=TABLE_DTYPE)
     n = v.shape[0]
-    E = np.full((n, n), np.nan, dtype=float)
+    E = np.full((n, n), np.nan, dtype=TABLE_DTYPE)
     E[0, :n] = v
+    if logR is None:
+        logR = _log_ratios(R)
+    if romberg_table is not None:
+        romberg_table(E, np.ascontiguousarray(logR, dtype=np.float64), EPSILON)
+        return E
 
     for k in range(1, n):
-        for i in range(n - k):
-            Ei = E[k-1, i]
-            Ej = E[k-1, i+1]
-            r = R[i]
-            p = compute_local_order(Ei, Ej, r)
-            denom = r**p - 1 if np.isfinite(p) else 0
-            E[k, i] = Ej + (Ej - Ei) / denom if denom != 0 else np.nan
+        Ei = E[k-1, :n-k]
+        Ej = E[k-1, 1:n-k+1]
+        logr = logR[:n-k]
+        p = _local_order(Ei, Ej, logr)
+        # r^p - 1 evaluated as exp(p * log r) - 1; bad cells are masked to NaN below.
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            denom = np.exp(p * logr) - 1.0
+            extrapolated = Ej + (Ej - Ei) / denom
+        E[k, :n-k] = np.where((denom == 0.0) | ~np.isfinite(denom), np.nan, extrapolated)
     return E
 
 def build_extrapolation_bounds(E: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -103,16 +225,14 @@ def build_extrapolation_bounds(E: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         Relative errors: |(E[k,i] - E[k-1,i+1]) / E[k,i]|.
     """
     n = E.shape[0]
-    abs_err = np.full_like(E, np.nan)
-    rel_err = np.full_like(E, np.nan)
+    abs_err = np.full(E.shape, np.nan, dtype=TABLE_DTYPE)
+    rel_err = np.full(E.shape, np.nan, dtype=TABLE_DTYPE)
 
     for k in range(1, n):
-        for i in range(n - k):
-            Ek_i = E[k, i]
-            Ekm1_ip1 = E[k - 1, i + 1]
-            if np.isfinite(Ek_i) and np.isfinite(Ekm1_ip1):
-                abs_err[k, i] = compute_absolute_difference(Ek_i, Ekm1_ip1)
-                rel_err[k, i] = compute_relative_difference(Ek_i, Ekm1_ip1)
+        Ek = E[k, :n-k]
+        Ekm1 = E[k-1, 1:n-k+1]
+        abs_err[k, :n-k] = np.abs(Ek - Ekm1)
+        rel_err[k, :n-k] = _safe_ratio(abs_err[k, :n-k], np.abs(Ekm1))
 
     return abs_err, rel_err
 
@@ -141,6 +261,83 @@ def build_gci_confidence_bounds(
     upper = E * (1 + GCI / 100.0)
     return lower, upper
 
+def build_all_tables(
+    E: np.ndarray,
+    R: np.ndarray,
+    safety_factor: float,
+    logR: Optional[np.ndarray] = None
+) -> TableBundle:
+    """
+    Build every per-level table derived from a Richardson table in a single sweep.
+
+    Parameters
+    ----------
+    E : np.ndarray
+        Richardson table (N x N).
+    R : np.ndarray
+        Local refinement ratios.
+    safety_factor : float
+        GCI safety multiplier (e.g., 1.25 or 3.0).
+    logR : np.ndarray, optional
+        Precomputed log(R); computed here if omitted.
+
+    Returns
+    -------
+    TableBundle
+        Named tuple with the fields below, backed by a single NaN-filled buffer.
+    P : np.ndarray
+        Table of observed orders of convergence.
+    GCI : np.ndarray
+        GCI table (% values).
+    Rel : np.ndarray
+        Relative error table.
+    abs_err : np.ndarray
+        Absolute extrapolation errors: |E[k,i] - E[k-1,i+1]|.
+    rel_err : np.ndarray
+        Relative extrapolation errors: |E[k,i] - E[k-1,i+1]| / |E[k-1,i+1]|.
+    GCI_ratio : np.ndarray
+        Table of GCI[k, i+1] / GCI[k, i] values.
+
+    Notes
+    -----
+    Each level reads the `E[k-1]` slices once and derives all outputs from
+    them, instead of re-walking the table once per output. When `numba` is
+    installed the sweep runs in the compiled `fused_tables` kernel.
+    """
+    if logR is None:
+        logR = _log_ratios(R)
+    if fused_tables is not None:
+        E = np.ascontiguousarray(E, dtype=np.float64)
+        logR = np.ascontiguousarray(logR, dtype=np.float64)
+    n = E.shape[0]
+    out = np.full((len(TableBundle._fields), n, n), np.nan, dtype=TABLE_DTYPE)
+    tables = TableBundle(*out)
+    P, GCI, Rel, abs_err, rel_err, GCI_ratio = tables
+
+    if fused_tables is not None:
+        clamped = fused_tables(E, logR, float(safety_factor), EPSILON, P, GCI, Rel, abs_err, rel_err, GCI_ratio)
+        if clamped:
+            msg = f"Division by near-zero detected: denominator abs<{EPSILON}"
+            if STRICT_MODE:
+                raise RuntimeError(msg)
+            warnings.warn(msg, RuntimeWarning)
+        return tables
+
+    sf100 = safety_factor * 100.0
+    for k in range(1, n):
+        m = n - k
+        Ei = E[k-1, :m]
+        Ej = E[k-1, 1:m+1]
+
+        P[k, :m], Rel[k, :m], GCI[k, :m] = _level_gci(Ei, Ej, logR[:m], sf100)
+
+        abs_err[k, :m] = np.abs(E[k, :m] - Ej)
+        rel_err[k, :m] = _safe_ratio(abs_err[k, :m], np.abs(Ej))
+        if m > 1:
+            GCI_ratio[k, :m-1] = _safe_ratio(GCI[k, 1:m], GCI[k, :m-1])
+
+    return tables
+
 def build_order_table(
     E: np.ndarray,
     R: np.ndarray
@@ -161,11 +358,11 @@ def build_order_table(
         Table of observed orders of convergence.
     """
     n = E.shape[0]
-    P = np.full_like(E, np.nan)
+    P = np.full(E.shape, np.nan, dtype=TABLE_DTYPE)
+    logR = _log_ratios(R)
 
     for k in range(1, n):
-        for i in range(n - k):
-            P[k, i] = compute_local_order(E[k-1, i], E[k-1, i+1], R[i])
+        P[k, :n-k] = _local_order(E[k-1, :n-k], E[k-1, 1:n-k+1], logR[:n-k])
     return P
 
 def build_gci_and_rel_eps(
@@ -193,17 +390,14 @@ def build_gci_and_rel_eps(
         Relative error table.
     """
     n = E.shape[0]
-    GCI = np.full_like(E, np.nan)
-    Rel = np.full_like(E, np.nan)
+    GCI = np.full((n, n), np.nan, dtype=TABLE_DTYPE)
+    Rel = np.full((n, n), np.nan, dtype=TABLE_DTYPE)
+    logR = _log_ratios(R)
+    sf100 = safety_factor * 100.0
 
     for k in range(1, n):
-        for i in range(n - k):
-            Ei = E[k-1, i]
-            Ej = E[k-1, i+1]
-            rel = compute_relative_difference(Ei, Ej)
-            Rel[k, i] = rel
-            p = compute_local_order(Ei, Ej, R[i])
-            GCI[k, i] = compute_gci(safety_factor, rel, R[i], p)
+        m = n - k
+        _, Rel[k, :m], GCI[k, :m] = _level_gci(E[k-1, :m], E[k-1, 1:m+1], logR[:m], sf100)
     return GCI, Rel
 
 def build_gci_ratio_table(
@@ -223,10 +417,9 @@ def build_gci_ratio_table(
         Table of GCI[k, i+1] / GCI[k, i] values.
     """
     n = GCI.shape[0]
-    GCI_ratio = np.full_like(GCI, np.nan)
-    for k in range(1, n):
-        for i in range(n - k - 1):
-            GCI_ratio[k, i] = safe_division(GCI[k, i+1], GCI[k, i])
+    GCI_ratio = np.full(GCI.shape, np.nan, dtype=TABLE_DTYPE)
+    for k in range(1, n - 1):
+        GCI_ratio[k, :n-k-1] = _safe_ratio(GCI[k, 1:n-k], GCI[k, :n-k-1])
     return GCI_ratio
 
 def build_level_flags(
@@ -255,7 +448,50 @@ def build_level_flags(
     asymptotic : bool
         True if GCI drops by a factor greater than asymptotic_ratio.
     """
-    monotonic = np.all(diffs > 0) or np.all(diffs < 0)
-    sign_flip = np.any(np.sign(diffs[:-1]) != np.sign(diffs[1:]))
-    asymptotic = np.all(gci_vals[1:] < asymptotic_ratio * gci_vals[:-1]) if len(gci_vals) > 1 else False
-    return monotonic, sign_flip, asymptotic
\ No newline at end of file
+    s = np.sign(diffs)
+    monotonic = s.size == 0 or bool(s[0] != 0 and (s == s[0]).all())
+    sign_flip = bool((s[1:] != s[:-1]).any())
+    asymptotic = gci_vals.size > 1 and bool(np.less(gci_vals[1:], asymptotic_ratio * gci_vals[:-1]).all())
+    return monotonic, sign_flip, asymptotic
+
+def build_level_flag_tables(
+    E: np.ndarray,
+    GCI: np.ndarray,
+    asymptotic_ratio: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate `build_level_flags` for every level of a Richardson table at once.
+
+    Parameters
+    ----------
+    E : np.ndarray
+        Richardson table (N x N).
+    GCI : np.ndarray
+        GCI table (N x N).
+    asymptotic_ratio : float
+        Tolerance threshold to assert asymptotic behavior.
+
+    Returns
+    -------
+    monotonic : np.ndarray
+        Boolean flags for levels 1..N-1 (entry `k-1` is level `k`).
+    sign_flip : np.ndarray
+        Boolean sign-change flags for levels 1..N-1.
+    asymptotic : np.ndarray
+        Boolean asymptotic flags for levels 1..N-1.
+    """
+    n = E.shape[0]
+    # Level k uses differences E[k-1, i] - E[k-1, i+1] for i < n-k.
+    cols = np.arange(n - 1)
+    valid = cols[None, :] < (n - 1 - cols)[:, None]
+    pair_valid = valid[:, 1:]
+
+    S = np.sign(E[:-1, :-1] - E[:-1, 1:])
+    first = S[:, :1]
+    monotonic = (first[:, 0] != 0) & ((S == first) | ~valid).all(axis=1)
+    sign_flip = ((S[:, 1:] != S[:, :-1]) & pair_valid).any(axis=1)
+
+    G = GCI[1:, :]
+    decreasing = np.less(G[:, 1:n-1], asymptotic_ratio * G[:, :n-2])
+    asymptotic = pair_valid.any(axis=1) & (decreasing | ~pair_valid).all(axis=1)
+    return monotonic, sign_flip, asymptotic
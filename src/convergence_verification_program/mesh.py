@@ -1,11 +1,42 @@
 # src\convergence_verification_program\mesh.py
 
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, field_validator, Field
+import sys
+from dataclasses import dataclass, asdict, field
+from operator import attrgetter, index
+from typing import Dict, Any, Iterable, List, Optional, Mapping, Sequence, Tuple
 from json import dumps
 
+import numpy as np
 
-class MeshData(BaseModel):
+# `slots=True` is only understood by dataclasses on Python >= 3.10.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def sort_by_node_count(meshes: Iterable["MeshData"]) -> List["MeshData"]:
+    """
+    Return the meshes as a new list in ascending node count order.
+
+    Input that is already ordered is copied without sorting.
+
+    Parameters
+    ----------
+    meshes : iterable of MeshData
+        Meshes in any order.
+
+    Returns
+    -------
+    List[MeshData]
+        A new list, stably sorted by node count.
+    """
+    ordered = list(meshes)
+    nodes = [m.node_count for m in ordered]
+    if any(a > b for a, b in zip(nodes, nodes[1:])):
+        ordered.sort(key=attrgetter('node_count'))
+    return ordered
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class MeshData:
     """
     Represents a single mesh used in a convergence study.
 
@@ -15,68 +46,52 @@ class MeshData(BaseModel):
         A unique identifier for the mesh.
     node_count : int
         The number of nodes in the mesh (must be positive).
-    parameters : Dict[str, float]
+    parameters : Mapping[str, float]
         A dictionary mapping parameter names to their computed values.
     dim : int, optional
         Dimensionality of the mesh (must be 1, 2, or 3). Defaults to 3.
-    units : Dict[str, str], optional
+    units : Mapping[str, str], optional
         Units associated with each parameter.
     """
-    identifier: str = Field(..., description="Unique mesh identifier")
-    node_count: int = Field(..., gt=0, description="Positive number of nodes in the mesh")
-    parameters: Dict[str, float] = Field(..., description="Parameter results for this mesh")
-    dim: Optional[int] = Field(3, description="Spatial dimension of the mesh (1, 2, or 3)")
-    units: Optional[Dict[str, str]] = Field(None, description="Optional units for parameter annotations")
+    identifier: str
+    node_count: int
+    parameters: Mapping[str, float]
+    dim: int = 3
+    units: Optional[Mapping[str, str]] = None
 
-    @field_validator('node_count')
-    @classmethod
-    def validate_node_count(cls, value: int) -> int:
+    def __post_init__(self) -> None:
         """
-        Ensure node count is strictly positive.
+        Normalize field types and validate node count and spatial dimension.
 
-        Parameters
-        ----------
-        value : int
-            The input node count.
-
-        Returns
-        -------
-        int
-            Validated node count.
+        Integer fields are converted to `int` (NumPy integers included) and
+        parameter values to `float`, stored in a new dictionary.
 
         Raises
         ------
         ValueError
-            If the node count is not greater than 0.
+            If the node count or dimension is not an integer, the node count is
+            not greater than 0, the dimension is not in {1, 2, 3}, or a
+            parameter value is not a number.
         """
-        if value <= 0:
+        try:
+            node_count = index(self.node_count)
+        except TypeError:
+            raise ValueError("Node count must be an integer") from None
+        if node_count <= 0:
             raise ValueError("Node count must be positive")
-        return value
-
-    @field_validator('dim')
-    @classmethod
-    def validate_dim(cls, value: Optional[int]) -> int:
-        """
-        Validate the spatial dimension value.
-
-        Parameters
-        ----------
-        value : int
-            The input dimension.
-
-        Returns
-        -------
-        int
-            Validated dimension value.
-
-        Raises
-        ------
-        ValueError
-            If dimension is not in {1, 2, 3}.
-        """
-        if value not in {1, 2, 3}:
+        try:
+            dim = index(self.dim)
+        except TypeError:
+            raise ValueError("Mesh dimension must be 1, 2, or 3.") from None
+        if dim not in {1, 2, 3}:
             raise ValueError("Mesh dimension must be 1, 2, or 3.")
-        return value
+        try:
+            parameters = {name: float(value) for name, value in self.parameters.items()}
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError("'parameters' must be a dictionary of floats") from None
+        object.__setattr__(self, "node_count", node_count)
+        object.__setattr__(self, "dim", dim)
+        object.__setattr__(self, "parameters", parameters)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MeshData":
@@ -100,20 +115,49 @@ class MeshData(BaseModel):
         ValueError
             If parameters are not valid.
         """
-        if not all(k in data for k in ('id', 'resolution', 'parameters')):
-            raise KeyError("Missing one or more required keys: 'id', 'resolution', 'parameters'")
+        try:
+            identifier, node_count, parameters = data['id'], data['resolution'], data['parameters']
+        except KeyError:
+            raise KeyError("Missing one or more required keys: 'id', 'resolution', 'parameters'") from None
 
-        if not isinstance(data['parameters'], dict):
+        if not isinstance(parameters, dict):
             raise ValueError("'parameters' must be a dictionary of floats")
 
         return cls(
-            identifier=data['id'],
-            node_count=data['resolution'],
-            parameters=data['parameters'],
+            identifier=identifier,
+            node_count=node_count,
+            parameters=parameters,
             dim=data.get('dim', 3),
             units=data.get('units')
         )
 
+    @classmethod
+    def from_dicts_bulk(cls, raw: Iterable[Dict[str, Any]]) -> List["MeshData"]:
+        """
+        Construct many MeshData objects from raw dictionaries.
+
+        Each record is parsed and validated by `from_dict`.
+
+        Parameters
+        ----------
+        raw : iterable of dict
+            Input dictionaries with keys 'id', 'resolution', and 'parameters'.
+
+        Returns
+        -------
+        List[MeshData]
+            Parsed mesh objects, in input order.
+
+        Raises
+        ------
+        KeyError
+            If required keys are missing.
+        ValueError
+            If parameters are not valid.
+        """
+        from_dict = cls.from_dict
+        return [from_dict(data) for data in raw]
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the mesh data to a dictionary.
@@ -123,21 +167,15 @@ class MeshData(BaseModel):
         dict
             Dictionary representation of the mesh.
         """
-        return {
-            "identifier": self.identifier,
-            "node_count": self.node_count,
-            "parameters": self.parameters,
-            "dim": self.dim,
-            "units": self.units
-        }
+        return asdict(self)
 
-    def to_json(self, indent: int = 4) -> str:
+    def to_json(self, indent: Optional[int] = 4) -> str:
         """
         Serialize the mesh data to JSON format.
 
         Parameters
         ----------
-        indent : int
+        indent : int or None
             Indentation level for formatting (default is 4).
 
         Returns
@@ -145,4 +183,130 @@ class MeshData(BaseModel):
         str
             JSON string.
         """
-        return dumps(self.to_dict(), indent=indent)
\ No newline at end of file
+        return dumps(self.to_dict(), indent=indent)
+
+
+@dataclass(frozen=True, eq=False, **_DATACLASS_OPTIONS)
+class MeshBundle:
+    """
+    Column-oriented (structure-of-arrays) view of a mesh sequence.
+
+    Attributes
+    ----------
+    identifiers : List[str]
+        Mesh identifiers, in ascending node count order.
+    node_counts : np.ndarray
+        Node counts (int64), aligned with `identifiers`.
+    dims : List[int]
+        Spatial dimension of each mesh.
+    param_matrix : np.ndarray
+        Parameter values (float64) of shape (n_meshes, n_params).
+    param_index : Dict[str, int]
+        Column of `param_matrix` holding each parameter.
+    """
+    identifiers: List[str]
+    node_counts: np.ndarray
+    dims: List[int]
+    param_matrix: np.ndarray
+    param_index: Dict[str, int]
+    _ratio_cache: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_meshes(cls, meshes: Sequence[MeshData]) -> "MeshBundle":
+        """
+        Build a bundle from MeshData objects, sorted by node count.
+
+        Parameters are taken from the first mesh after sorting.
+
+        Parameters
+        ----------
+        meshes : Sequence[MeshData]
+            Meshes to bundle (need not be sorted).
+
+        Returns
+        -------
+        MeshBundle
+            Column-oriented mesh data.
+
+        Raises
+        ------
+        ValueError
+            If `meshes` is empty.
+        KeyError
+            If a mesh lacks one of the first mesh's parameters.
+        """
+        if not meshes:
+            raise ValueError("Cannot build a MeshBundle from an empty mesh sequence.")
+        ordered = sort_by_node_count(meshes)
+        names = list(ordered[0].parameters)
+        return cls(
+            identifiers=[m.identifier for m in ordered],
+            node_counts=np.fromiter((m.node_count for m in ordered), dtype=np.int64, count=len(ordered)),
+            dims=[m.dim for m in ordered],
+            param_matrix=np.array(
+                [[m.parameters[p] for p in names] for m in ordered], dtype=np.float64
+            ).reshape(len(ordered), len(names)),
+            param_index={p: i for i, p in enumerate(names)}
+        )
+
+    def column(self, parameter: str) -> np.ndarray:
+        """
+        Values of one parameter across all meshes (a view, not a copy).
+
+        Raises
+        ------
+        KeyError
+            If the parameter is not in the bundle.
+        """
+        return self.param_matrix[:, self.param_index[parameter]]
+
+    def refinement_ratios(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Refinement ratios of adjacent meshes and their natural logs.
+
+        Computed on first use and shared by every parameter analyzed on
+        this bundle.
+
+        Returns
+        -------
+        tuple of np.ndarray, or None
+            (ratios, log ratios) of length n_meshes - 1, or None when the
+            meshes do not share a single dimension.
+        """
+        if self.dims.count(self.dims[0]) != len(self.dims):
+            return None
+        cache = self._ratio_cache
+        if not cache:
+            # Imported here so that loading mesh.py stays free of the table utilities.
+            from .local_intra_tuple_convergence_utils import build_refinement_ratios
+            cache["r"] = build_refinement_ratios(self.node_counts, self.dims[0])
+            cache["logr"] = np.log(cache["r"])
+        return cache["r"], cache["logr"]
+
+    def prime_refinement_ratios(self, ratios: np.ndarray) -> None:
+        """
+        Seed the ratio cache with ratios already computed elsewhere.
+
+        Parameters
+        ----------
+        ratios : np.ndarray
+            Refinement ratio of each adjacent mesh pair (length n_meshes - 1),
+            e.g. as returned by `validate_mesh_sequence(..., return_ratios=True)`.
+            Ignored when the meshes do not share a single dimension.
+
+        Raises
+        ------
+        ValueError
+            If `ratios` does not have shape (n_meshes - 1,).
+        """
+        r = np.asarray(ratios, dtype=np.float64)
+        if r.shape != (len(self.identifiers) - 1,):
+            raise ValueError(
+                f"Expected {len(self.identifiers) - 1} refinement ratios, got shape {r.shape}."
+            )
+        if self.dims.count(self.dims[0]) == len(self.dims):
+            self._ratio_cache["r"] = r
+            self._ratio_cache["logr"] = np.log(r)
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
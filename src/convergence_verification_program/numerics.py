@@ -1,14 +1,11 @@
 # src\convergence_verification_program\numerics.py
 
+import math
 import numpy as np
 import warnings
 from typing import Union
 from .config import STRICT_MODE
 
-# If in strict mode, convert warnings to errors globally
-if STRICT_MODE:
-    warnings.simplefilter("error", RuntimeWarning)
-
 def safe_division(
     numerator: Union[float, np.ndarray],
     denominator: Union[float, np.ndarray],
@@ -38,26 +35,67 @@ def safe_division(
     RuntimeWarning or RuntimeError
         Triggered for near-zero denominators depending on STRICT_MODE.
     """
+    if isinstance(numerator, (int, float)) and isinstance(denominator, (int, float)):
+        if not (math.isfinite(numerator) and math.isfinite(denominator)):
+            raise ValueError("Inputs to safe_division must be finite.")
+        if abs(denominator) < eps:
+            msg = f"Division by near-zero detected: denominator abs<{eps}"
+            if STRICT_MODE:
+                raise RuntimeError(msg)
+            warnings.warn(msg, RuntimeWarning)
+            return math.copysign(math.inf, numerator) if numerator else math.nan
+        return numerator / denominator
+
     num = np.asarray(numerator, dtype=float)
     den = np.asarray(denominator, dtype=float)
 
-    if not np.all(np.isfinite(num)) or not np.all(np.isfinite(den)):
+    if not (np.isfinite(num).all() and np.isfinite(den).all()):
         raise ValueError("Inputs to safe_division must be finite.")
 
     small = np.abs(den) < eps
-    if np.any(small):
+    any_small = small.any()
+    if any_small:
         msg = f"Division by near-zero detected: denominator abs<{eps}"
         if STRICT_MODE:
             raise RuntimeError(msg)
         warnings.warn(msg, RuntimeWarning)
 
-    result = np.empty_like(num, dtype=float)
-    mask = ~small
-    result[mask] = num[mask] / den[mask]
-    result[small] = np.sign(num[small]) * np.inf
+    result = np.divide(num, den, out=np.full(num.shape, np.nan), where=~small)
+    if any_small:
+        result[small] = np.sign(num[small]) * np.inf
 
     return result.item() if result.shape == () else result
 
+def safe_division_vec(
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    eps: float = 1e-12
+) -> np.ndarray:
+    """
+    Unchecked array counterpart of `safe_division` for vectorized hot paths.
+
+    Inputs are not validated and no near-zero warning is emitted; callers
+    that need STRICT_MODE semantics must check denominators themselves.
+
+    Parameters
+    ----------
+    numerator : ndarray
+        Numerator values.
+    denominator : ndarray
+        Denominator values (broadcastable against `numerator`).
+    eps : float, optional
+        Threshold below which denominators are considered near-zero (default: 1e-12).
+
+    Returns
+    -------
+    ndarray
+        Quotients, with `sign(numerator) * inf` where the denominator is too small.
+    """
+    num = np.asarray(numerator, dtype=float)
+    den = np.asarray(denominator, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(np.abs(den) < eps, np.sign(num) * np.inf, num / den)
+
 def safe_log(
     value: Union[float, np.ndarray],
     eps: float = 1e-12
@@ -84,20 +122,34 @@ def safe_log(
     RuntimeWarning or RuntimeError
         If flooring occurs, depending on STRICT_MODE.
     """
+    if isinstance(value, (int, float)):
+        if not math.isfinite(value):
+            raise ValueError("Inputs to safe_log must be finite.")
+        if value <= 0:
+            raise ValueError("Inputs to safe_log must be positive.")
+        if value < eps:
+            msg = f"Values below eps={eps} floored for log stability."
+            if STRICT_MODE:
+                raise RuntimeError(msg)
+            warnings.warn(msg, RuntimeWarning)
+            return math.log(eps)
+        return math.log(value)
+
     v = np.asarray(value, dtype=float)
-    if not np.all(np.isfinite(v)):
+    if not np.isfinite(v).all():
         raise ValueError("Inputs to safe_log must be finite.")
-    if np.any(v <= 0):
+    # A single min() reduction drives both the positivity and flooring checks.
+    lo = v.min() if v.size else eps
+    if lo <= 0:
         raise ValueError("Inputs to safe_log must be positive.")
 
-    floor_mask = v < eps
-    if np.any(floor_mask):
+    if lo < eps:
         msg = f"Values below eps={eps} floored for log stability."
         if STRICT_MODE:
             raise RuntimeError(msg)
         warnings.warn(msg, RuntimeWarning)
-    v_clipped = np.where(floor_mask, eps, v)
-    result = np.log(v_clipped)
+        v = np.maximum(v, eps)
+    result = np.log(v)
     return result.item() if result.shape == () else result
 
 def calculate_refinement_ratio(
@@ -157,9 +209,10 @@ def compute_local_order(Ei: float, Ej: float, r: float, eps: float = 1e-12) -> f
     float
         Observed order `p`, or NaN if invalid.
     """
-    if r > 0 and abs(Ei - Ej) > eps:
-        return safe_log(abs(Ei - Ej), eps) / safe_log(r, eps)
-    return np.nan
+    d = abs(Ei - Ej)
+    if r > 0 and r != 1.0 and d > eps:
+        return math.log(d) / math.log(r)
+    return float('nan')
 
 def compute_relative_difference(a: float, b: float, eps: float = 1e-12) -> float:
     """
@@ -0,0 +1,141 @@
+# src\convergence_verification_program\numerics_numba.py
+
+"""
+Optional Numba-compiled kernels for the Richardson table builders.
+
+`numba` is not a hard dependency. When it cannot be imported, `romberg_table`
+and `fused_tables` are set to None and callers fall back to the NumPy
+implementation.
+"""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+# All fast-math flags except 'nnan'/'ninf': the kernel relies on NaN checks.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def _ratio(num: float, den: float, eps: float) -> float:
+    """
+    Scalar `safe_division` body; returns NaN for non-finite inputs.
+    Near-zero denominators yield signed infinity (NaN for a zero numerator).
+    """
+    if not (math.isfinite(num) and math.isfinite(den)):
+        return math.nan
+    if abs(den) < eps:
+        return math.copysign(math.inf, num) if num != 0.0 else math.nan
+    return num / den
+
+
+def _local_order(d: float, logr: float, eps: float) -> float:
+    """
+    Scalar `compute_local_order` body on a precomputed difference and log-ratio.
+    """
+    if math.isfinite(logr) and logr != 0.0 and d > eps:
+        return math.log(d) / logr
+    return math.nan
+
+
+def _romberg_table(E, logR, eps):
+    """
+    Fill levels 1..N-1 of a Richardson table in place.
+
+    Parameters
+    ----------
+    E : np.ndarray
+        (N x N) table whose first row holds the mesh solutions; other
+        entries must be NaN on entry.
+    logR : np.ndarray
+        Natural log of the local refinement ratios (float64).
+    eps : float
+        Near-zero threshold for solution differences.
+    """
+    n = E.shape[0]
+    for k in range(1, n):
+        for i in range(n - k):
+            Ei = E[k - 1, i]
+            Ej = E[k - 1, i + 1]
+            logr = logR[i]
+            p = _local_order(abs(Ei - Ej), logr, eps)
+            denom = math.exp(p * logr) - 1.0
+            if denom == 0.0 or not math.isfinite(denom):
+                E[k, i] = math.nan
+            else:
+                E[k, i] = Ej + (Ej - Ei) / denom
+
+
+def _fused_tables(E, logR, safety_factor, eps, P, GCI, Rel, AbsErr, RelErr, GCIRatio):
+    """
+    Fill the order, GCI, relative error, extrapolation error and GCI ratio tables.
+
+    Parameters
+    ----------
+    E : np.ndarray
+        Richardson table (N x N, C-contiguous float64).
+    logR : np.ndarray
+        Natural log of the local refinement ratios (float64).
+    safety_factor : float
+        GCI safety multiplier.
+    eps : float
+        Near-zero threshold for differences and denominators.
+    P, GCI, Rel, AbsErr, RelErr, GCIRatio : np.ndarray
+        Preallocated NaN-filled (N x N) float64 output tables.
+
+    Returns
+    -------
+    int
+        Number of divisions by a near-zero denominator; the caller decides
+        whether to warn or raise.
+    """
+    n = E.shape[0]
+    clamped = 0
+    sf100 = safety_factor * 100.0
+    for k in range(1, n):
+        for i in range(n - k):
+            Ei = E[k - 1, i]
+            Ej = E[k - 1, i + 1]
+            logr = logR[i]
+            d = abs(Ei - Ej)
+
+            p = _local_order(d, logr, eps)
+            P[k, i] = p
+
+            if math.isfinite(d) and math.isfinite(Ej) and abs(Ej) < eps:
+                clamped += 1
+            rel = _ratio(d, abs(Ej), eps)
+            Rel[k, i] = rel
+
+            denom = math.exp(p * logr) - 1.0
+            if denom == 0.0 or not math.isfinite(denom):
+                GCI[k, i] = math.nan
+            else:
+                GCI[k, i] = sf100 * rel / denom
+
+            a = abs(E[k, i] - Ej)
+            AbsErr[k, i] = a
+            if math.isfinite(a) and math.isfinite(Ej) and abs(Ej) < eps:
+                clamped += 1
+            RelErr[k, i] = _ratio(a, abs(Ej), eps)
+
+        for i in range(n - k - 1):
+            g0 = GCI[k, i]
+            g1 = GCI[k, i + 1]
+            if math.isfinite(g0) and math.isfinite(g1) and abs(g0) < eps:
+                clamped += 1
+            GCIRatio[k, i] = _ratio(g1, g0, eps)
+    return clamped
+
+
+if njit is not None:
+    _jit = njit(cache=True, fastmath=_FASTMATH, error_model="numpy")
+    _ratio = _jit(_ratio)
+    _local_order = _jit(_local_order)
+    romberg_table = _jit(_romberg_table)
+    fused_tables = _jit(_fused_tables)
+else:
+    romberg_table = None
+    fused_tables = None
@@ -1,200 +1,280 @@
 # src\convergence_verification_program\report.py
 
-from typing import Dict
+import os
+from functools import lru_cache
+from typing import Dict, Iterator
 from .config import REPORT_FORMAT, REPORT_FLOAT_PRECISION
 
 
 def export_report(results: Dict) -> str:
-    if REPORT_FORMAT == "txt":
-        return _export_txt(results)
-    elif REPORT_FORMAT == "md":
-        return _export_markdown(results)
-    elif REPORT_FORMAT == "tex":
-        return _export_latex(results)
-    else:
-        raise ValueError(f"Unsupported report format: {REPORT_FORMAT}")
+    return ''.join(_iter_report(results, REPORT_FORMAT))
 
 
 def save_report(results: Dict, filepath: str) -> None:
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(export_report(results))
+    # Stream the report chunks to a sibling temporary file rather than
+    # building the whole report string first, then move it into place so a
+    # failure while rendering never leaves a truncated report at `filepath`.
+    chunks = _iter_report(results, REPORT_FORMAT)
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    f = open(tmp_path, "x", encoding="utf-8", buffering=65536)
+    try:
+        with f:
+            f.writelines(chunks)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _iter_report(results: Dict, fmt: str) -> Iterator[str]:
+    """Report chunks for `fmt`; raises ValueError before any chunk is produced."""
+    # The txt and md renderers end every line with a newline; drop the last
+    # one so the output matches a '\n'.join of the lines.
+    if fmt == "txt":
+        return _drop_final_newline(_iter_txt(results))
+    elif fmt == "md":
+        return _drop_final_newline(_iter_markdown(results))
+    elif fmt == "tex":
+        return _iter_latex(results)
+    else:
+        raise ValueError(f"Unsupported report format: {fmt}")
+
+
+def _drop_final_newline(chunks: Iterator[str]) -> Iterator[str]:
+    """Yield `chunks` unchanged except for the final newline of the last one."""
+    prev = next(chunks, "")
+    for chunk in chunks:
+        yield prev
+        prev = chunk
+    yield prev[:-1]
+
+
+@lru_cache(maxsize=8)
+def _templates(p: int) -> Dict[str, str]:
+    """Row templates with the float precision `p` baked into each format spec."""
+    f = f".{p}f"
+    return {
+        "txt_pair": f"    Pair {{i}}: R={{r:{f}}}, err={{err:{f}}}, rel={{rel:{f}}}, GCI={{gci:{f}}}\n",
+        "txt_global": f"  Global: order_fp={{ofp:{f}}}, order_avg={{oavg:{f}}}, gci_fp={{gfp:{f}}}, ratio={{glob:{f}}}\n",
+        "txt_inter": f"  Tuple {{i}}: Δorder={{delta_order:{f}}}, Δgci={{delta_gci:{f}}}\n",
+        "txt_flags": "    Level {lvl} flags: monotonic={mono}, signflip={sf}, asymptotic={asym}\n",
+        "md_pair": f"| {{i}} | {{r:{f}}} | {{err:{f}}} | {{rel:{f}}} | {{gci:{f}}} |\n",
+        "md_global": (
+            f"**Global Summaries**\n"
+            f"- Order (finest): {{ofp:{f}}}  \n"
+            f"- Order (avg): {{oavg:{f}}}  \n"
+            f"- GCI (finest): {{gfp:{f}}}  \n"
+            f"- GCI Ratio: {{glob:{f}}}  \n"
+        ),
+        "md_inter": f"| {{i}} | {{delta_order:{f}}} | {{delta_gci:{f}}} |\n",
+        "md_flags": "- Level {lvl}: monotonic={mono}, signflip={sf}, asymptotic={asym}  \n",
+        "tex_pair": f"{{i}} & {{r:{f}}} & {{err:{f}}} & {{rel:{f}}} & {{gci:{f}}}\\\n",
+        "tex_global": (
+            "\\subsubsection*{{Global Summaries}}\n"
+            "\\begin{{tabular}}{{lcccc}}\n"
+            "\\toprule\n"
+            "Metric & Order_{{fp}} & Order_{{avg}} & GCI_{{fp}} & Ratio\\\\\n"
+            "\\midrule\n"
+            f"{{idx}} & {{ofp:{f}}} & {{oavg:{f}}} & {{gfp:{f}}}\\% & {{glob:{f}}}\\\n"
+            "\\bottomrule\\end{{tabular}}\\n\n"
+        ),
+        "tex_inter": f"{{i}} & {{delta_order:{f}}} & {{delta_gci:{f}}}\\\n",
+    }
 
 # ==============================
 # Plain Text Report
 # ==============================
 
-def _export_txt(results: Dict) -> str:
+def _iter_txt(results: Dict) -> Iterator[str]:
     p = REPORT_FLOAT_PRECISION
-    lines = ["CONVERGENCE STUDY REPORT", f"Standard: {results['standard']}", f"Tuple Size: {results.get('tuple_size')}", f"Meshes: {', '.join(results['meshes'])}"]
+    fmt = f"{{:.{p}f}}".format
+    t = _templates(p)
+    yield f"CONVERGENCE STUDY REPORT\nStandard: {results['standard']}\nTuple Size: {results.get('tuple_size')}\nMeshes: {', '.join(results['meshes'])}\n"
     for param, data in results['parameters'].items():
-        lines.append(f"\nParameter: {param}")
-        for tup in data['tuples']:
-            idx = data['tuples'].index(tup) + 1
+        yield f"\nParameter: {param}\n"
+        for idx, tup in enumerate(data['tuples'], 1):
             mt = ' -> '.join(tup['mesh_tuple'])
             if 'error' in tup:
-                lines.append(f"Tuple {idx}: ERROR {tup['error']}")
+                yield f"Tuple {idx}: ERROR {tup['error']}\n"
                 continue
             # Raw errors & ratios
-            lines.append(f"  Tuple {idx} Mesh-Pair Metrics:")
-            for i, r in enumerate(tup['refinement_ratios']):
-                err = tup['errors'][i]
-                rel = tup['rel_eps_table'][1][i]
-                gci = tup['GCI_table'][1][i]
-                lines.append(f"    Pair {i+1}: R={r:.{p}f}, err={err:.{p}f}, rel={rel:.{p}f}, GCI={gci:.{p}f}" )
+            yield f"  Tuple {idx} Mesh-Pair Metrics:\n"
+            rel_row = tup['rel_eps_table'][1]
+            gci_row = tup['GCI_table'][1]
+            for i, (r, err) in enumerate(zip(tup['refinement_ratios'], tup['errors'])):
+                yield t['txt_pair'].format(i=i+1, r=r, err=err, rel=rel_row[i], gci=gci_row[i])
             # Romberg / order / GCI tables
-            lines.append("  Richardson Extrapolation Table:")
+            yield "  Richardson Extrapolation Table:\n"
             for lvl, row in tup['R_table'].items():
-                vals = ', '.join(f"{v:.{p}f}" for v in row.values())
-                lines.append(f"    Level {lvl}: {vals}")
-            lines.append("  Observed Orders:")
+                yield f"    Level {lvl}: {', '.join(map(fmt, row.values()))}\n"
+            yield "  Observed Orders:\n"
             for lvl, row in tup['p_table'].items():
-                vals = ', '.join(f"{v:.{p}f}" for v in row.values())
-                lines.append(f"    Level {lvl}: {vals}")
+                yield f"    Level {lvl}: {', '.join(map(fmt, row.values()))}\n"
             # Global summaries
-            ofp = tup['order_finest_pair']
-            oavg = tup['order_tuple_avg']
-            gfp = tup['gci_finest_pair']
-            glob = tup['global_gci_ratio']
-            lines.append(f"  Global: order_fp={ofp:.{p}f}, order_avg={oavg:.{p}f}, gci_fp={gfp:.{p}f}, ratio={glob:.{p}f}")
+            yield t['txt_global'].format(
+                ofp=tup['order_finest_pair'],
+                oavg=tup['order_tuple_avg'],
+                gfp=tup['gci_finest_pair'],
+                glob=tup['global_gci_ratio']
+            )
             # Flags
-            for lvl in tup['monotonic_table']:
-                mono = tup['monotonic_table'][lvl]
-                sf = tup['signflip_table'][lvl]
-                asym = tup['asymptotic_table'][lvl]
-                lines.append(f"    Level {lvl} flags: monotonic={mono}, signflip={sf}, asymptotic={asym}")
+            for lvl, (mono, sf, asym) in tup['flags_table'].items():
+                yield t['txt_flags'].format(lvl=lvl, mono=mono, sf=sf, asym=asym)
         # Inter-tuple
-        lines.append("\nInter-Tuple Trends:")
+        yield "\nInter-Tuple Trends:\n"
         for i, tup in enumerate(data['tuples'],1):
             if 'error' in tup: continue
             d = tup['inter_tuple']
-            lines.append(f"  Tuple {i}: Δorder={d['delta_order']:.{p}f}, Δgci={d['delta_gci']:.{p}f}")
-    return '\n'.join(lines)
+            yield t['txt_inter'].format(i=i, delta_order=d['delta_order'], delta_gci=d['delta_gci'])
+
+
+def _export_txt(results: Dict) -> str:
+    return ''.join(_iter_report(results, "txt"))
 
 # ==============================
 # Markdown Report
 # ==============================
 
-def _export_markdown(results: Dict) -> str:
+def _iter_markdown(results: Dict) -> Iterator[str]:
     p = REPORT_FLOAT_PRECISION
-    md = ["# Convergence Study Report", f"**Standard:** {results['standard']}  ", f"**Tuple Size:** {results.get('tuple_size')}  ", f"**Meshes:** {', '.join(results['meshes'])}"]
+    fmt = f"{{:.{p}f}}".format
+    t = _templates(p)
+    yield f"# Convergence Study Report\n**Standard:** {results['standard']}  \n**Tuple Size:** {results.get('tuple_size')}  \n**Meshes:** {', '.join(results['meshes'])}\n"
     for param, data in results['parameters'].items():
-        md.append(f"## Parameter: `{param}`")
-        for tup in data['tuples']:
-            idx = data['tuples'].index(tup) + 1
+        yield f"## Parameter: `{param}`\n"
+        for idx, tup in enumerate(data['tuples'], 1):
             if 'error' in tup:
-                md.append(f"- **Tuple {idx}: ERROR** {tup['error']}")
+                yield f"- **Tuple {idx}: ERROR** {tup['error']}\n"
                 continue
-            md.append(f"### Tuple {idx}: Mesh Tuple `{ ' → '.join(tup['mesh_tuple']) }`")
+            yield f"### Tuple {idx}: Mesh Tuple `{ ' → '.join(tup['mesh_tuple']) }`\n"
             # Mesh-Pair Metrics
-            md.append("**Mesh-Pair Metrics**")
-            md.append("| Pair | R | Error | RelErr | GCI |")
-            md.append("|------|---|-------|--------|-----|")
-            for i, r in enumerate(tup['refinement_ratios']):
-                err = tup['errors'][i]
-                rel = tup['rel_eps_table'][1][i]
-                gci = tup['GCI_table'][1][i]
-                md.append(f"| {i+1} | {r:.{p}f} | {err:.{p}f} | {rel:.{p}f} | {gci:.{p}f} |")
+            yield ("**Mesh-Pair Metrics**\n"
+                   "| Pair | R | Error | RelErr | GCI |\n"
+                   "|------|---|-------|--------|-----|\n")
+            rel_row = tup['rel_eps_table'][1]
+            gci_row = tup['GCI_table'][1]
+            for i, (r, err) in enumerate(zip(tup['refinement_ratios'], tup['errors'])):
+                yield t['md_pair'].format(i=i+1, r=r, err=err, rel=rel_row[i], gci=gci_row[i])
             # Romberg table
-            md.append("**Richardson Extrapolation Table**")
-            headers = "| Level | " + " | ".join(str(l) for l in tup['R_table'].keys()) + " |"
-            md.append(headers)
-            md.append("|-----|" + "----|"*len(tup['R_table']) )
-            vals = "| R | " + " | ".join(f"{v:.{p}f}" for v in tup['R_table'].values()) + " |"
-            md.append(vals)
+            R_table = tup['R_table']
+            yield "**Richardson Extrapolation Table**\n"
+            yield "| Level | " + " | ".join(str(l) for l in R_table.keys()) + " |\n"
+            yield "|-----|" + "----|"*len(R_table) + "\n"
+            yield "| R | " + " | ".join(map(fmt, R_table.values())) + " |\n"
             # Global summary
-            md.append("**Global Summaries**")
-            ofp = tup['order_finest_pair']
-            oavg = tup['order_tuple_avg']
-            gfp = tup['gci_finest_pair']
-            glob = tup['global_gci_ratio']
-            md.append(f"- Order (finest): {ofp:.{p}f}  ")
-            md.append(f"- Order (avg): {oavg:.{p}f}  ")
-            md.append(f"- GCI (finest): {gfp:.{p}f}  ")
-            md.append(f"- GCI Ratio: {glob:.{p}f}  ")
+            yield t['md_global'].format(
+                ofp=tup['order_finest_pair'],
+                oavg=tup['order_tuple_avg'],
+                gfp=tup['gci_finest_pair'],
+                glob=tup['global_gci_ratio']
+            )
             # Flags
-            md.append("**Flags by Level**")
-            for lvl in tup['monotonic_table']:
-                md.append(f"- Level {lvl}: monotonic={tup['monotonic_table'][lvl]}, signflip={tup['signflip_table'][lvl]}, asymptotic={tup['asymptotic_table'][lvl]}  ")
+            yield "**Flags by Level**\n"
+            for lvl, (mono, sf, asym) in tup['flags_table'].items():
+                yield t['md_flags'].format(lvl=lvl, mono=mono, sf=sf, asym=asym)
         # Inter-tuple
-        md.append("## Inter-Tuple Trends")
-        md.append("| Tuple | ΔOrder | ΔGCI |")
-        md.append("|-------|--------|------|")
+        yield ("## Inter-Tuple Trends\n"
+               "| Tuple | ΔOrder | ΔGCI |\n"
+               "|-------|--------|------|\n")
         for i, tup in enumerate(data['tuples'],1):
             if 'error' in tup: continue
             d = tup['inter_tuple']
-            md.append(f"| {i} | {d['delta_order']:.{p}f} | {d['delta_gci']:.{p}f} |")
-    return '\n'.join(md)
+            yield t['md_inter'].format(i=i, delta_order=d['delta_order'], delta_gci=d['delta_gci'])
+
+
+def _export_markdown(results: Dict) -> str:
+    return ''.join(_iter_report(results, "md"))
 
 # ==============================
 # LaTeX Report
 # ==============================
 
-def _export_latex(results: Dict) -> str:
+# Fixed LaTeX blocks, shared by every report.
+_LATEX_PREAMBLE = "\\documentclass{article}\n\\usepackage{booktabs}\n\\begin{document}\n\\section*{Convergence Study Report}\n"
+_LATEX_PAIR_HEAD = (
+    "\\subsubsection*{Mesh-Pair Metrics}\n"
+    "\\begin{tabular}{lcccc}\n"
+    "\\toprule\n"
+    "Pair & R & Error & RelErr & GCI \\\\\n"
+    "\\midrule\n"
+)
+_LATEX_RICHARDSON = (
+    "\\subsubsection*{{Richardson Table}}\n"
+    "\\begin{{tabular}}{{l{cols}}}\n"
+    "\\toprule\n"
+    "Tuple & {head}\\\\\n"
+    "\\midrule\n"
+    "{idx} & {row}\\\\\n"
+    "\\bottomrule\\end{{tabular}}\\n\n"
+)
+_LATEX_FLAGS_HEAD = (
+    "\\subsubsection*{Flags}\n"
+    "\\begin{tabular}{lccc}\n"
+    "\\toprule\n"
+    "Level & Mono & SignFlip & Asym\\\\\n"
+    "\\midrule\n"
+)
+_LATEX_INTER_HEAD = (
+    "\\subsection*{Inter-Tuple Trends}\n"
+    "\\begin{tabular}{lcc}\n"
+    "\\toprule\n"
+    "Tuple & DeltaOrder & DeltaGCI\\\\\n"
+    "\\midrule\n"
+)
+# Flag column text, indexed by the flag's truth value.
+_YN = ('N', 'Y')
+_LATEX_TABLE_END = "\\bottomrule\\end{tabular}\\n\n"
+
+def _iter_latex(results: Dict) -> Iterator[str]:
     p = REPORT_FLOAT_PRECISION
-    latex = [r"\documentclass{article}", r"\usepackage{booktabs}", r"\begin{document}"]
-    latex.append(r"\section*{Convergence Study Report}")
-    latex.append(f"\\textbf{{Standard:}} {results['standard']}\\\\")
-    latex.append(f"\\textbf{{Tuple Size:}} {results.get('tuple_size')}\\\\")
-    latex.append(f"\\textbf{{Meshes:}} {', '.join(results['meshes'])}\\\\\n")
+    fmt = f"{{:.{p}f}}".format
+    t = _templates(p)
+    yield _LATEX_PREAMBLE
+    yield f"\\textbf{{Standard:}} {results['standard']}\\\\\n"
+    yield f"\\textbf{{Tuple Size:}} {results.get('tuple_size')}\\\\\n"
+    yield f"\\textbf{{Meshes:}} {', '.join(results['meshes'])}\\\\\n\n"
     for param, data in results['parameters'].items():
-        latex.append(f"\\subsection*{{Parameter: \texttt{{{param}}}}}")
-        for tup in data['tuples']:
-            idx = data['tuples'].index(tup) + 1
+        yield f"\\subsection*{{Parameter: \texttt{{{param}}}}}\n"
+        for idx, tup in enumerate(data['tuples'], 1):
             if 'error' in tup:
-                latex.append(rf"{idx} & ERROR & \multicolumn{{3}}{{l}}{{{tup['error']}}}\\")
+                yield rf"{idx} & ERROR & \multicolumn{{3}}{{l}}{{{tup['error']}}}\\" "\n"
                 continue
             # Mesh-Pair
-            latex.append(r"\subsubsection*{Mesh-Pair Metrics}")
-            latex.append(r"\begin{tabular}{lcccc}")
-            latex.append(r"\toprule")
-            latex.append(r"Pair & R & Error & RelErr & GCI \\")
-            latex.append(r"\midrule")
-            for i, r in enumerate(tup['refinement_ratios']):
-                err = tup['errors'][i]
-                rel = tup['rel_eps_table'][1][i]
-                gci = tup['GCI_table'][1][i]
-                latex.append(f"{i+1} & {r:.{p}f} & {err:.{p}f} & {rel:.{p}f} & {gci:.{p}f}\\")
-            latex.append(r"\bottomrule\end{tabular}\n")
+            yield _LATEX_PAIR_HEAD
+            for i, (r, e, rl, g) in enumerate(zip(
+                tup['refinement_ratios'], tup['errors'],
+                tup['rel_eps_table'][1], tup['GCI_table'][1]
+            ), 1):
+                yield t['tex_pair'].format(i=i, r=r, err=e, rel=rl, gci=g)
+            yield _LATEX_TABLE_END
             # Romberg
-            latex.append(r"\subsubsection*{Richardson Table}")
             levels = sorted(tup['R_table'].keys())
-            cols = 'l' + 'c'*len(levels)
-            latex.append(rf"\begin{{tabular}}{{{cols}}}")
-            latex.append(r"\toprule")
-            head = ' & '.join(f"L{lvl}" for lvl in levels)
-            latex.append(rf"Tuple & {head}\\")
-            latex.append(r"\midrule")
-            row = ' & '.join(f"{tup['R_table'][lvl][idx-1]:.{p}f}" for lvl in levels)
-            latex.append(rf"{idx} & {row}\\")
-            latex.append(r"\bottomrule\end{tabular}\n")
+            yield _LATEX_RICHARDSON.format(
+                cols='c'*len(levels),
+                head=' & '.join(f"L{lvl}" for lvl in levels),
+                idx=idx,
+                row=' & '.join(fmt(tup['R_table'][lvl][idx-1]) for lvl in levels)
+            )
             # Global
-            latex.append(r"\subsubsection*{Global Summaries}")
-            ofp = tup['order_finest_pair']; oavg = tup['order_tuple_avg']; gfp = tup['gci_finest_pair']; glob = tup['global_gci_ratio']
-            latex.append(r"\begin{tabular}{lcccc}")
-            latex.append(r"\toprule")
-            latex.append(r"Metric & Order_{fp} & Order_{avg} & GCI_{fp} & Ratio\\")
-            latex.append(r"\midrule")
-            latex.append(f"{idx} & {ofp:.{p}f} & {oavg:.{p}f} & {gfp:.{p}f}\% & {glob:.{p}f}\\")
-            latex.append(r"\bottomrule\end{tabular}\n")
+            yield t['tex_global'].format(
+                idx=idx,
+                ofp=tup['order_finest_pair'],
+                oavg=tup['order_tuple_avg'],
+                gfp=tup['gci_finest_pair'],
+                glob=tup['global_gci_ratio']
+            )
             # Flags
-            latex.append(r"\subsubsection*{Flags}")
-            latex.append(r"\begin{tabular}{lccc}")
-            latex.append(r"\toprule")
-            latex.append(r"Level & Mono & SignFlip & Asym\\")
-            latex.append(r"\midrule")
-            for lvl in tup['monotonic_table']:
-                mono = tup['monotonic_table'][lvl]; sf = tup['signflip_table'][lvl]; asym = tup['asymptotic_table'][lvl]
-                latex.append(f"{lvl} & {'Y' if mono else 'N'} & {'Y' if sf else 'N'} & {'Y' if asym else 'N'}\\")
-            latex.append(r"\bottomrule\end{tabular}\n")
+            yield _LATEX_FLAGS_HEAD
+            for lvl, (mono, sf, asym) in tup['flags_table'].items():
+                yield f"{lvl} & {_YN[int(mono)]} & {_YN[int(sf)]} & {_YN[int(asym)]}\\\n"
+            yield _LATEX_TABLE_END
         # Inter-tuple
-        latex.append(r"\subsection*{Inter-Tuple Trends}")
-        latex.append(r"\begin{tabular}{lcc}")
-        latex.append(r"\toprule")
-        latex.append(r"Tuple & DeltaOrder & DeltaGCI\\")
-        latex.append(r"\midrule")
-        for i, tup in enumerate(data['tuples'],1):
-            d = tup['inter_tuple']
-            latex.append(f"{i} & {d['delta_order']:.{p}f} & {d['delta_gci']:.{p}f}\\")
-        latex.append(r"\bottomrule\end{tabular}\n")
-    latex.append(r"\end{document}")
-    return '\n'.join(latex)
\ No newline at end of file
+        yield _LATEX_INTER_HEAD
+        for i, tup in enumerate(data['tuples'], 1):
+            yield t['tex_inter'].format(i=i, **tup['inter_tuple'])
+        yield _LATEX_TABLE_END
+    yield r"\end{document}"
+
+
+def _export_latex(results: Dict) -> str:
+    return ''.join(_iter_report(results, "tex"))
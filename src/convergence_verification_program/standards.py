@@ -1,10 +1,11 @@
 # src\convergence_verification_program\standards.py
 
 from enum import Enum
-from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Tuple, List, Union
 from types import MappingProxyType
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict
 
 
 class AnalysisStandard(Enum):
@@ -14,11 +15,12 @@ class AnalysisStandard(Enum):
     CUSTOM = "User-defined"
 
 
-@dataclass(frozen=True)
 class StandardParameters:
     """
     Numerical parameters for a specific analysis standard.
 
+    Instances are immutable; attribute assignment raises AttributeError.
+
     Attributes
     ----------
     min_refinement : float
@@ -34,12 +36,52 @@ class StandardParameters:
     residual_tol : float
         Default residual tolerance.
     """
-    min_refinement: float
-    max_refinement: float
-    asymptotic_ratio: float
-    safety_factor: float
-    order_tolerance: float
-    residual_tol: float = 1e-6
+    __slots__ = (
+        "min_refinement", "max_refinement", "asymptotic_ratio",
+        "safety_factor", "order_tolerance", "residual_tol", "_d",
+    )
+
+    def __init__(
+        self,
+        min_refinement: float,
+        max_refinement: float,
+        asymptotic_ratio: float,
+        safety_factor: float,
+        order_tolerance: float,
+        residual_tol: float = 1e-6,
+    ) -> None:
+        d = {
+            "min_refinement": min_refinement,
+            "max_refinement": max_refinement,
+            "asymptotic_ratio": asymptotic_ratio,
+            "safety_factor": safety_factor,
+            "order_tolerance": order_tolerance,
+            "residual_tol": residual_tol,
+        }
+        for name, value in d.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_d", MappingProxyType(d))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (type(self), tuple(self._d.values()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self._d.items())
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return tuple(self._d.values()) == tuple(other._d.values())
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._d.values()))
 
     def to_dict(self) -> Dict[str, float]:
         """
@@ -50,14 +92,7 @@ class StandardParameters:
         Dict[str, float]
             Dictionary representation of the parameters.
         """
-        return {
-            "min_refinement": self.min_refinement,
-            "max_refinement": self.max_refinement,
-            "asymptotic_ratio": self.asymptotic_ratio,
-            "safety_factor": self.safety_factor,
-            "order_tolerance": self.order_tolerance,
-            "residual_tol": self.residual_tol,
-        }
+        return dict(self._d)
 
 
 class StandardRegistry:
@@ -103,10 +138,7 @@ class StandardRegistry:
         KeyError
             If the standard is not registered.
         """
-        key = standard if isinstance(standard, AnalysisStandard) else AnalysisStandard(standard)
-        if key not in cls._PARAMETERS:
-            raise KeyError(f"Standard '{key}' not registered.")
-        return cls._PARAMETERS[key]
+        return _resolve(standard)
 
     @classmethod
     def register_custom_standard(cls, name: str, params: Dict[str, float]) -> None:
@@ -131,6 +163,25 @@ class StandardRegistry:
             standard_enum = AnalysisStandard.CUSTOM
 
         cls._PARAMETERS[standard_enum] = StandardParameters(**params)
+        _resolve.cache_clear()
+        StandardValidator._cached.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _resolve(standard: Union[AnalysisStandard, str]) -> StandardParameters:
+    """
+    Resolve a standard (enum member or value string) to its registered
+    parameters (cached per distinct argument).
+
+    Raises
+    ------
+    KeyError
+        If the standard is not registered.
+    """
+    key = AnalysisStandard(standard)
+    if key not in StandardRegistry._PARAMETERS:
+        raise KeyError(f"Standard '{key}' not registered.")
+    return StandardRegistry._PARAMETERS[key]
 
 
 class StandardValidator(BaseModel):
@@ -144,6 +195,9 @@ class StandardValidator(BaseModel):
     parameters : StandardParameters
         Numerical parameters associated with the standard.
     """
+    # Frozen because from_standard hands out shared, cached instances.
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
     standard: AnalysisStandard
     parameters: StandardParameters
 
@@ -160,12 +214,15 @@ class StandardValidator(BaseModel):
         Returns
         -------
         StandardValidator
-            A validator instance with fetched parameters.
+            A validator instance with fetched parameters, shared between
+            calls for the same standard.
         """
-        return cls(
-            standard=standard if isinstance(standard, AnalysisStandard) else AnalysisStandard(standard),
-            parameters=StandardRegistry.get_parameters(standard)
-        )
+        return cls._cached(standard if isinstance(standard, AnalysisStandard) else AnalysisStandard(standard))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _cached(cls, key: AnalysisStandard) -> "StandardValidator":
+        return cls(standard=key, parameters=StandardRegistry.get_parameters(key))
 
     def validate_refinement(self, ratio: float) -> Tuple[bool, str]:
         """
@@ -250,15 +307,19 @@ class ComplianceReport:
         )
 
     def _format_refinement(self, ratios: List[float]) -> str:
-        messages = [self.validator.validate_refinement(ratio)[1] for ratio in ratios]
+        arr = np.asarray(ratios, dtype=float)
+        params = self.validator.parameters
+        bad = ~((arr >= params.min_refinement) & (arr <= params.max_refinement))
+        messages = ["Valid refinement ratio"] * arr.size
+        # Only out-of-range ratios need their message formatted.
+        for i in np.flatnonzero(bad):
+            messages[i] = self.validator.validate_refinement(float(arr[i]))[1]
         return "; ".join(messages)
 
     def _format_asymptotic(self, gci: List[float]) -> str:
-        flags = [
-            self.validator.is_asymptotic(gci[i - 1], gci[i])
-            for i in range(1, len(gci))
-        ]
-        return "Convergent" if all(flags) else "Non-asymptotic behavior detected"
+        # Stops at the first non-asymptotic pair.
+        convergent = all(self.validator.is_asymptotic(prev, cur) for prev, cur in zip(gci, gci[1:]))
+        return "Convergent" if convergent else "Non-asymptotic behavior detected"
 
     def _format_order(self, orders: List[float]) -> str:
         avg_order = sum(orders) / len(orders)
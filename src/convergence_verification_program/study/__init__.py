@@ -4,13 +4,17 @@ study/__init__.py
 This module provides unified access to all convergence study routines, including:
 - Intra-tuple analysis (Romberg extrapolation, GCI, order estimation)
 - Inter-tuple analysis (deltas, trend tracking)
+- The ConvergenceStudy orchestrator
 
 This package assumes that all mesh and parameter validation has been handled externally.
 """
 
-from .intra_tuple_analysis import classify_convergence_type, analyze_parameter
+from .intra_tuple_analysis import IntraGlobal, classify_convergence_type, analyze_parameter
+from .convergence_study import ConvergenceStudy
 
 __all__ = [
+    "ConvergenceStudy",
+    "IntraGlobal",
     "classify_convergence_type",
     "analyze_parameter"
 ]
@@ -0,0 +1,141 @@
+# src\convergence_verification_program\study\convergence_study.py
+
+from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import warnings
+
+from ..mesh import MeshData, MeshBundle, sort_by_node_count
+from ..standards import StandardValidator, AnalysisStandard
+from ..validation import validate_mesh_sequence
+from ..config import STRICT_MODE
+from .intra_tuple_analysis import analyze_parameter
+
+
+def _init_strict_worker() -> None:
+    """Promote RuntimeWarnings to errors inside a pool worker process."""
+    warnings.simplefilter("error", RuntimeWarning)
+
+
+class ConvergenceStudy:
+    """
+    Orchestrates intra-tuple convergence analysis for a mesh sequence.
+
+    This class performs tuple-wise Richardson extrapolation, GCI analysis,
+    and convergence classification for each scalar parameter in a CFD or
+    numerical simulation study. It validates against a predefined standard,
+    and reports summary metrics such as observed order, extrapolation error,
+    and asymptotic convergence indicators.
+
+    Parameters
+    ----------
+    meshes : List[MeshData]
+        A list of MeshData objects, sorted in ascending mesh resolution.
+    standard : AnalysisStandard
+        The convergence analysis standard (e.g., ASME, ISO) specifying GCI
+        safety factors, asymptotic thresholds, and reporting behavior.
+    tuple_size : int, optional
+        Number of meshes per tuple for local convergence analysis. Default is 3.
+
+    Attributes
+    ----------
+    meshes : List[MeshData]
+        Sorted list of input meshes.
+    validator : StandardValidator
+        Validator with standard-specific numerical thresholds and tolerances.
+    tuple_size : int
+        Number of meshes to include in each analysis tuple.
+    results : Optional[Dict]
+        Final structured report produced by the analysis.
+    """
+
+    def __init__(
+        self,
+        meshes: List[MeshData],
+        standard: AnalysisStandard,
+        tuple_size: int = 3
+    ):
+        if len(meshes) < tuple_size:
+            raise ValueError(f"Require at least {tuple_size} meshes, got {len(meshes)}.")
+        self.meshes = sort_by_node_count(meshes)
+        self.validator = StandardValidator.from_standard(standard)
+        self.tuple_size = tuple_size
+        self.results: Optional[Dict] = None
+
+    def perform_analysis(self, workers: int = 1) -> Dict:
+        """
+        Execute convergence analysis across all mesh tuples and parameters.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of worker processes used to analyze parameters in
+            parallel. The default of 1 runs serially, which is faster for
+            typical study sizes where process start-up dominates.
+
+        Returns
+        -------
+        Dict
+            Structured report containing:
+            - analysis standard identifier
+            - tuple size used
+            - mesh identifiers in the study
+            - parameter-wise convergence results per tuple
+
+        Raises
+        ------
+        ValueError
+            If mesh sequence fails standard compliance checks.
+        RuntimeWarning or RuntimeError
+            If STRICT_MODE is active and numerical anomalies are detected.
+        """
+        # Validation, the column-oriented bundle and the report are all derived
+        # here from one ordering of the current `meshes`, so the validated
+        # ratios always describe the meshes being analyzed.
+        meshes = sort_by_node_count(self.meshes)
+        bundle = MeshBundle.from_meshes(meshes)
+        _, ratios = validate_mesh_sequence(
+            meshes,
+            self.validator.parameters,
+            strict=True,
+            return_ratios=True
+        )
+        # Reuse the validated ratios for every parameter's analysis.
+        bundle.prime_refinement_ratios(ratios)
+
+        report: Dict = {
+            "standard": self.validator.standard.value,
+            "tuple_size": self.tuple_size,
+            "meshes": [m.identifier for m in meshes],
+            "parameters": {}
+        }
+
+        params = list(bundle.param_index)
+        kwargs = {
+            "meshes": bundle,
+            "tuple_size": self.tuple_size,
+            "safety_factor": self.validator.parameters.safety_factor,
+            "asymptotic_ratio": self.validator.parameters.asymptotic_ratio
+        }
+
+        # Parameters are independent, so they can fan out across processes
+        # when the caller opts in.
+        if workers > 1 and len(params) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(params)),
+                initializer=_init_strict_worker if STRICT_MODE else None
+            ) as ex:
+                futs = {p: ex.submit(analyze_parameter, parameter=p, **kwargs) for p in params}
+                report["parameters"] = {p: {"tuples": f.result()} for p, f in futs.items()}
+        else:
+            # Promote RuntimeWarnings to errors for the analysis only, rather
+            # than mutating the process-wide warnings filter.
+            with warnings.catch_warnings():
+                if STRICT_MODE:
+                    warnings.simplefilter("error", RuntimeWarning)
+                for param in params:
+                    report["parameters"][param] = {
+                        "tuples": analyze_parameter(parameter=param, **kwargs)
+                    }
+
+        self.results = report
+        return report
\ No newline at end of file
@@ -13,7 +13,7 @@ def compute_inter_tuple_metrics(
     ----------
     all_results : List[Dict]
         List of convergence results from intra-tuple analysis. Each entry must contain
-        a "global_intra_tuple" dictionary with keys 'order_finest_pair' and 'gci_finest_pair'.
+        a "global_intra_tuple" IntraGlobal record.
 
     Returns
     -------
@@ -23,30 +23,31 @@ def compute_inter_tuple_metrics(
     """
     inter_results: List[Dict] = []
 
-    for i in range(1, len(all_results)):
-        prev = all_results[i - 1]["global_intra_tuple"]
-        curr = all_results[i]["global_intra_tuple"]
+    count = len(all_results)
+    order = np.fromiter((r["global_intra_tuple"].order_finest_pair for r in all_results), dtype=float, count=count)
+    gci = np.fromiter((r["global_intra_tuple"].gci_finest_pair for r in all_results), dtype=float, count=count)
 
-        order_prev = prev["order_finest_pair"]
-        order_curr = curr["order_finest_pair"]
-        gci_prev = prev["gci_finest_pair"]
-        gci_curr = curr["gci_finest_pair"]
+    delta_order = np.round(np.diff(order), 3)
+    delta_gci = np.round(np.diff(gci), 3)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rel_order = np.round(np.abs(delta_order / order[:-1]), 3)
+        rel_gci = np.round(np.abs(delta_gci / gci[:-1]), 3)
 
-        delta_order = round(order_curr - order_prev, 3)
-        delta_gci = round(gci_curr - gci_prev, 3)
-
-        rel_order = round(abs(delta_order / order_prev), 3) if order_prev else None
-        rel_gci = round(abs(delta_gci / gci_prev), 3) if gci_prev else None
+    delta_order, delta_gci = delta_order.tolist(), delta_gci.tolist()
+    rel_order, rel_gci = rel_order.tolist(), rel_gci.tolist()
+    has_order, has_gci = (order[:-1] != 0).tolist(), (gci[:-1] != 0).tolist()
 
+    for i in range(1, count):
+        j = i - 1
         inter_results.append({
             "mesh_tuple": all_results[i]["mesh_tuple"],
             "local_inter_tuple": {
-                "delta_order_vs_prev_tuple": delta_order,
-                "delta_gci_vs_prev_tuple": delta_gci
+                "delta_order_vs_prev_tuple": delta_order[j],
+                "delta_gci_vs_prev_tuple": delta_gci[j]
             },
             "global_inter_tuple": {
-                "relative_order_change": rel_order,
-                "relative_gci_change": rel_gci
+                "relative_order_change": rel_order[j] if has_order[j] else None,
+                "relative_gci_change": rel_gci[j] if has_gci[j] else None
             }
         })
 
@@ -1,21 +1,59 @@
 # src\convergence_verification_program\study\intra_tuple_analysis.py
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Union
+from dataclasses import dataclass, asdict
+import math
 import numpy as np
 
-from ..mesh import MeshData
+from ..mesh import MeshData, MeshBundle, _DATACLASS_OPTIONS
 from ..numerics import safe_division
 from ..local_intra_tuple_convergence_utils import (
     build_refinement_ratios,
     build_romberg_table,
-    build_order_table,
-    build_gci_and_rel_eps,
-    build_level_flags,
-    build_gci_ratio_table,
-    build_extrapolation_bounds,
+    build_all_tables,
+    build_level_flag_tables,
     build_gci_confidence_bounds
 )
 
+@dataclass(**_DATACLASS_OPTIONS)
+class IntraGlobal:
+    """
+    Global convergence summary of a single mesh tuple.
+
+    Attributes
+    ----------
+    order_finest_pair : float
+        Observed order of the finest mesh pair.
+    order_tuple_avg : float
+        Mean observed order across the tuple's first-level pairs.
+    gci_finest_pair : float
+        GCI of the finest mesh pair.
+    global_gci_ratio : float or None
+        Finest-pair GCI over coarsest-pair GCI; None if the latter is zero.
+    """
+    order_finest_pair: float
+    order_tuple_avg: float
+    gci_finest_pair: float
+    global_gci_ratio: Optional[float]
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """
+        Convert the summary to a dictionary for serialization.
+
+        Returns
+        -------
+        dict
+            Field names mapped to their values.
+        """
+        return asdict(self)
+
+
+# Indexed by (asymptotic << 2) | (sign_flip << 1) | order_ok.
+_TABLE = (
+    "uncertain", "uncertain", "oscillatory", "oscillatory",
+    "uncertain", "asymptotic", "oscillatory", "oscillatory",
+)
+
 def classify_convergence_type(
     asymptotic: bool,
     sign_flip: bool,
@@ -41,14 +79,11 @@ def classify_convergence_type(
     str
         One of 'asymptotic', 'oscillatory', or 'uncertain'.
     """
-    if asymptotic and not sign_flip and abs(order - round(order)) < order_tol:
-        return "asymptotic"
-    if sign_flip:
-        return "oscillatory"
-    return "uncertain"
+    order_ok = math.isfinite(order) and abs(order - round(order)) < order_tol
+    return _TABLE[(bool(asymptotic) << 2) | (bool(sign_flip) << 1) | order_ok]
 
 def analyze_parameter(
-    meshes: List[MeshData],
+    meshes: Union[List[MeshData], MeshBundle],
     parameter: str,
     tuple_size: int,
     safety_factor: float,
@@ -59,8 +94,9 @@ def analyze_parameter(
 
     Parameters
     ----------
-    meshes : List[MeshData]
-        Mesh data objects sorted by increasing resolution.
+    meshes : List[MeshData] or MeshBundle
+        Mesh data objects sorted by increasing resolution, or a MeshBundle
+        whose parameter column is then used directly.
     parameter : str
         Parameter to analyze (e.g., velocity, pressure).
     tuple_size : int
@@ -77,39 +113,67 @@ def analyze_parameter(
     """
     n = tuple_size
     results: List[Dict] = []
+    if len(meshes) < n:
+        return results
+
+    # Extract per-mesh data once; each window below is a zero-copy slice.
+    if isinstance(meshes, MeshBundle):
+        all_vals = meshes.column(parameter)
+        node_counts = meshes.node_counts
+        ids = meshes.identifiers
+        dims = meshes.dims
+    else:
+        all_vals = np.fromiter((m.parameters[parameter] for m in meshes), dtype=np.float64, count=len(meshes))
+        node_counts = np.fromiter((m.node_count for m in meshes), dtype=np.int64, count=len(meshes))
+        ids = [m.identifier for m in meshes]
+        dims = [m.dim for m in meshes]
+    window_has_nan = np.lib.stride_tricks.sliding_window_view(np.isnan(all_vals), n).any(axis=1)
+
+    # With a single dimension every window's ratios are a slice of one sweep
+    # over all adjacent mesh pairs (cached on a MeshBundle across parameters);
+    # mixed dimensions fall back to per-window.
+    if isinstance(meshes, MeshBundle):
+        shared = meshes.refinement_ratios()
+    elif dims.count(dims[0]) == len(dims):
+        r_all = build_refinement_ratios(node_counts, dims[0])
+        shared = r_all, np.log(r_all)
+    else:
+        shared = None
+    uniform_dim = shared is not None
+    if uniform_dim:
+        r_all, logr_all = shared
+
+    # Per-call invariants: level-1 column of the finest pair and its span.
+    fp = n - 2
+    lvl1 = slice(0, n - 1)
+    append = results.append
 
     for start in range(len(meshes) - n + 1):
-        subset = meshes[start:start + n]
-        vals = np.array([m.parameters[parameter] for m in subset], dtype=float)
-        if np.any(np.isnan(vals)):
+        if window_has_nan[start]:
             continue
+        stop = start + n
+        vals = all_vals[start:stop]
 
-        r = build_refinement_ratios([m.node_count for m in subset], subset[0].dim)
-        R = build_romberg_table(vals, r)
-        p = build_order_table(R, r)
-        GCI, rel_eps = build_gci_and_rel_eps(R, r, safety_factor)
-        GCI_ratio = build_gci_ratio_table(GCI)
-        abs_err, rel_err = build_extrapolation_bounds(R)
+        if uniform_dim:
+            r, logr = r_all[start:stop-1], logr_all[start:stop-1]
+        else:
+            r = build_refinement_ratios(node_counts[start:stop], dims[start])
+            logr = np.log(r)
+        R = build_romberg_table(vals, r, logr)
+        p, GCI, rel_eps, abs_err, rel_err, GCI_ratio = build_all_tables(R, r, safety_factor, logr)
         gci_lower, gci_upper = build_gci_confidence_bounds(R, GCI)
 
-        monotonic_flags, signflip_flags, asymp_flags = {}, {}, {}
-        for lvl in range(1, n):
-            diffs = R[lvl-1, :n-lvl] - R[lvl-1, 1:n-lvl+1]
-            gci_vals = GCI[lvl, :n-lvl]
-            mono, sf, asym = build_level_flags(diffs, gci_vals, asymptotic_ratio)
-            monotonic_flags[lvl] = mono
-            signflip_flags[lvl] = sf
-            asymp_flags[lvl] = asym
-
-        lvl = 1
-        order_fp = p[lvl, n-lvl-1]
-        order_avg = float(np.nanmean(p[lvl, :n-lvl]))
-        gci_fp = GCI[lvl, n-lvl-1]
-        gci_start = GCI[lvl, 0]
+        mono, sf, asym = build_level_flag_tables(R, GCI, asymptotic_ratio)
+        flags = dict(enumerate(zip(mono.tolist(), sf.tolist(), asym.tolist()), 1))
+
+        order_fp = p[1, fp]
+        order_avg = float(np.nanmean(p[1, lvl1]))
+        gci_fp = GCI[1, fp]
+        gci_start = GCI[1, 0]
         global_gci = float(safe_division(gci_fp, gci_start)) if gci_start else None
 
-        results.append({
-            "mesh_tuple": [m.identifier for m in subset],
+        append({
+            "mesh_tuple": ids[start:stop],
             "local_intra_tuple": {
                 "r_table": r,
                 "R_table": R,
@@ -121,16 +185,9 @@ def analyze_parameter(
                 "rel_extrapolation_error": rel_err,
                 "confidence_interval_lower": gci_lower,
                 "confidence_interval_upper": gci_upper,
-                "monotonic_table": monotonic_flags,
-                "signflip_table": signflip_flags,
-                "asymptotic_table": asymp_flags,
+                "flags_table": flags,
             },
-            "global_intra_tuple": {
-                "order_finest_pair": float(round(order_fp, 3)),
-                "order_tuple_avg": float(round(order_avg, 3)),
-                "gci_finest_pair": float(round(gci_fp, 3)),
-                "global_gci_ratio": global_gci
-            }
+            "global_intra_tuple": IntraGlobal(float(order_fp), order_avg, float(gci_fp), global_gci)
         })
 
     return results
\ No newline at end of file
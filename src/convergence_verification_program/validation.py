@@ -1,19 +1,60 @@
 # src\convergence_verification_program\validation.py
 
-from typing import List, Dict
+import numpy as np
+from typing import List, Dict, Tuple, Union
 from .mesh import MeshData
 from .standards import StandardParameters
 from .exceptions import InvalidRefinementSequenceError
-from .numerics import calculate_refinement_ratio
 from .config import STRICT_MODE
 
 
+def _validate_pairs(
+    node_counts: np.ndarray,
+    dims: np.ndarray,
+    min_refinement: float,
+    max_refinement: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute refinement ratios and bound checks for all consecutive mesh pairs.
+
+    Parameters
+    ----------
+    node_counts : np.ndarray
+        Node count of each mesh, in sequence order.
+    dims : np.ndarray
+        Spatial dimension of each mesh; pair `i` uses `dims[i]`.
+    min_refinement : float
+        Lower bound on the refinement ratio.
+    max_refinement : float
+        Upper bound on the refinement ratio.
+
+    Returns
+    -------
+    ratios : np.ndarray
+        Refinement ratios (fine / coarse)^(1/dim), length N-1.
+    valid : np.ndarray
+        Boolean mask of ratios within [min_refinement, max_refinement].
+    """
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        ratios = node_counts[1:] / node_counts[:-1]
+        if (dims[:-1] == dims[0]).all():
+            # A scalar exponent, as in `build_refinement_ratios`, so the ratios
+            # are bit-identical to the ones the analysis would compute.
+            if dims[0] != 1:
+                ratios = ratios ** (1.0 / dims[0])
+        else:
+            ratios = ratios ** (1.0 / dims[:-1])
+    valid = (ratios >= min_refinement) & (ratios <= max_refinement)
+    return ratios, valid
+
+
 def validate_mesh_sequence(
     meshes: List[MeshData],
     parameters: StandardParameters,
     strict: bool = True,
-    verbose: bool = False
-) -> List[Dict]:
+    verbose: bool = False,
+    return_ratios: bool = False
+) -> Union[List[Dict], Tuple[List[Dict], np.ndarray]]:
     """
     Validate mesh refinement ratios using per-mesh dimension.
 
@@ -27,11 +68,17 @@ def validate_mesh_sequence(
         Whether to raise an exception if validation fails (default is True).
     verbose : bool, optional
         Whether to print technically descriptive failure messages (default is False).
+    return_ratios : bool, optional
+        Also return the computed refinement ratios so callers can reuse them
+        instead of recomputing (default is False).
 
     Returns
     -------
     List[Dict]
         List of validation results, including ratio and status.
+    np.ndarray
+        Refinement ratio of each consecutive mesh pair (length N-1); only
+        returned when `return_ratios` is True.
 
     Raises
     ------
@@ -47,9 +94,31 @@ def validate_mesh_sequence(
             print(f"[Validation Error] {msg}")
         raise InvalidRefinementSequenceError(msg)
 
+    # Node counts need no re-check here: MeshData rejects non-positive
+    # counts at construction and instances are frozen.
     report = []
 
-    for i in range(len(meshes) - 1):
+    count = len(meshes)
+    dims = np.fromiter((m.dim for m in meshes), dtype=np.float64, count=count)
+    ratios, valid_mask = _validate_pairs(
+        np.fromiter((m.node_count for m in meshes), dtype=np.float64, count=count),
+        dims,
+        parameters.min_refinement,
+        parameters.max_refinement
+    )
+
+    pairs = range(count - 1)
+    if strict and not verbose:
+        # Nothing is printed, so jump straight to the first failing pair
+        # (if any) and let the loop body raise for it.
+        failed = ~(valid_mask & np.isin(dims[:-1], (1, 2, 3)))
+        if failed.any():
+            first = int(np.argmax(failed))
+            pairs = range(first, first + 1)
+    ratio_list = ratios.tolist()
+    valid_list = valid_mask.tolist()
+
+    for i in pairs:
         m1 = meshes[i]
         m2 = meshes[i + 1]
         dim = m1.dim
@@ -61,22 +130,8 @@ def validate_mesh_sequence(
             if strict:
                 raise InvalidRefinementSequenceError(msg)
 
-        if m1.node_count <= 0 or m2.node_count <= 0:
-            msg = f"Non-positive node count in mesh pair: {m1.identifier}, {m2.identifier}"
-            if verbose:
-                print(f"[Validation Error] {msg}")
-            if strict:
-                raise InvalidRefinementSequenceError(msg)
-            report.append({
-                "index": i,
-                "meshes": (m1.identifier, m2.identifier),
-                "status": "invalid_node_count",
-                "message": msg
-            })
-            continue
-
-        ratio = calculate_refinement_ratio(m1.node_count, m2.node_count, dim)
-        valid = parameters.min_refinement <= ratio <= parameters.max_refinement
+        ratio = ratio_list[i]
+        valid = valid_list[i]
 
         message = "OK" if valid else (
             f"Refinement ratio {ratio:.2f} outside allowed range "
@@ -101,4 +156,6 @@ def validate_mesh_sequence(
 
         report.append(result)
 
+    if return_ratios:
+        return report, ratios
     return report
\ No newline at end of file